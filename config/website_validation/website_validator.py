@@ -42,6 +42,8 @@ def get_requests_required_headers(url: str, config: Config) -> list:
             # pylint: disable=protected-access
             tmp_config._headers = {key: value for key, value in
                                    config._headers.items() if key in headers_attempt}
+            tmp_config.get_session().headers = requests.utils.default_headers()
+            tmp_config.get_session().headers.update(tmp_config._headers)
             response = make_request(url, tmp_config)
             if response.status_code == 200:
                 return headers_attempt
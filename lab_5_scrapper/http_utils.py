@@ -0,0 +1,212 @@
+"""
+Helpers for sending requests to the website.
+"""
+import asyncio
+import hashlib
+import json
+import pathlib
+import time
+from threading import Lock
+from typing import Any, Mapping, Optional, Union
+from urllib.parse import urlsplit
+
+import requests
+
+
+class RequestThrottler:
+    """
+    Keeps requests to the same host at least a minimal interval apart.
+    """
+
+    def __init__(self, min_interval: float) -> None:
+        """
+        Initialize an instance of the RequestThrottler class.
+
+        Args:
+            min_interval (float): Minimal number of seconds between requests to one host
+        """
+        self._min_interval = min_interval
+        self._last_request_ts: dict[str, float] = {}
+        self._lock = Lock()
+
+    def __getstate__(self) -> dict:
+        """
+        Retrieve state to copy or pickle without the lock.
+
+        Returns:
+            dict: Throttler state
+        """
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restore copied or pickled state with a new lock.
+
+        Args:
+            state (dict): Throttler state
+        """
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def _reserve(self, url: str) -> float:
+        """
+        Book the earliest free moment to request the host of url.
+
+        Args:
+            url (str): Site url
+
+        Returns:
+            float: Number of seconds to wait before the request
+        """
+        host = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            last_request_ts = self._last_request_ts.get(host)
+            if last_request_ts is None:
+                request_ts = now
+            else:
+                request_ts = max(now, last_request_ts + self._min_interval)
+            self._last_request_ts[host] = request_ts
+        return request_ts - now
+
+    def wait(self, url: str) -> None:
+        """
+        Block until url may be requested.
+
+        Args:
+            url (str): Site url
+        """
+        time.sleep(self._reserve(url))
+
+    async def wait_async(self, url: str) -> None:
+        """
+        Suspend the coroutine until url may be requested.
+
+        Args:
+            url (str): Site url
+        """
+        await asyncio.sleep(self._reserve(url))
+
+
+class ThrottledSession(requests.Session):
+    """
+    Session that waits for its throttler before every request.
+    """
+
+    __attrs__ = requests.Session.__attrs__ + ['_throttler']
+
+    def __init__(self, throttler: RequestThrottler) -> None:
+        """
+        Initialize an instance of the ThrottledSession class.
+
+        Args:
+            throttler (RequestThrottler): Throttler of requests to one host
+        """
+        super().__init__()
+        self._throttler = throttler
+
+    def request(self, method: Union[str, bytes], url: Union[str, bytes],
+                *args: Any, **kwargs: Any) -> requests.Response:
+        """
+        Send a request once its host may be requested.
+
+        Args:
+            method (Union[str, bytes]): HTTP method
+            url (Union[str, bytes]): Site url
+            *args (Any): Positional arguments of requests.Session.request
+            **kwargs (Any): Keyword arguments of requests.Session.request
+
+        Returns:
+            requests.Response: A response from a request
+        """
+        self._throttler.wait(url.decode() if isinstance(url, bytes) else url)
+        return super().request(method, url, *args, **kwargs)
+
+
+class PageCache:
+    """
+    Stores downloaded pages on disk with their ETag and Last-Modified validators.
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        """
+        Initialize an instance of the PageCache class.
+
+        Args:
+            path (pathlib.Path): Directory to store pages in
+        """
+        self._path = path
+        self._path.mkdir(parents=True, exist_ok=True)
+
+    def _get_paths(self, url: str) -> tuple[pathlib.Path, pathlib.Path]:
+        """
+        Build paths of page and its validators for url.
+
+        Args:
+            url (str): Site url
+
+        Returns:
+            tuple[pathlib.Path, pathlib.Path]: Paths of page and its validators
+        """
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self._path / f'{key}.html', self._path / f'{key}.json'
+
+    def get_validators(self, url: str) -> dict[str, str]:
+        """
+        Build headers to revalidate cached page of url.
+
+        Args:
+            url (str): Site url
+
+        Returns:
+            dict[str, str]: Conditional request headers, empty if page is not cached
+        """
+        page_path, validators_path = self._get_paths(url)
+        if not page_path.exists() or not validators_path.exists():
+            return {}
+        try:
+            validators = json.loads(validators_path.read_text(encoding='utf-8'))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return {}
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        return headers
+
+    def load(self, url: str) -> Optional[bytes]:
+        """
+        Read cached page of url.
+
+        Args:
+            url (str): Site url
+
+        Returns:
+            Optional[bytes]: Cached page or None if it is not cached
+        """
+        page_path, _ = self._get_paths(url)
+        try:
+            return page_path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def store(self, url: str, page: bytes, headers: Mapping[str, str]) -> None:
+        """
+        Save page of url if response headers allow to revalidate it later.
+
+        Args:
+            url (str): Site url
+            page (bytes): Downloaded page
+            headers (Mapping[str, str]): Response headers
+        """
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        page_path, validators_path = self._get_paths(url)
+        page_path.write_bytes(page)
+        validators_path.write_text(json.dumps({'etag': etag, 'last_modified': last_modified}),
+                                   encoding='utf-8')
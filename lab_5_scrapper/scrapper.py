@@ -1,22 +1,92 @@
 """
 Crawler implementation.
 """
+import asyncio
+import codecs
 import datetime
 import json
+import logging
+import os
 # pylint: disable=too-many-arguments, too-many-instance-attributes, unused-import, undefined-variable
 import pathlib
-import random
-import shutil
-import time
-from typing import Pattern, Union
-
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+from itertools import repeat
+from queue import Queue
+from typing import Optional, Pattern, Sequence, Union
+
+import aiohttp
+import lxml  # noqa: F401
 import requests
-from bs4 import BeautifulSoup
-
-from core_utils.article.article import Article
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+from bs4.element import Tag
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+try:
+    from selectolax.lexbor import LexborHTMLParser, LexborNode
+except ImportError:
+    LexborHTMLParser = None  # type: ignore
+    LexborNode = None  # type: ignore
+
+from core_utils.article.article import Article, get_article_id_from_filepath
 from core_utils.article.io import to_meta, to_raw
 from core_utils.config_dto import ConfigDTO
 from core_utils.constants import ASSETS_PATH, CRAWLER_CONFIG_PATH
+from lab_5_scrapper.http_utils import PageCache, RequestThrottler, ThrottledSession
+
+MAX_CONCURRENT_REQUESTS = 32
+MAX_SEED_REQUEST_WORKERS = 16
+MAX_CONNECTIONS_PER_HOST = 64
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 64
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+PARSING_CHUNK_SIZE = 8
+DEFAULT_MIN_REQUEST_INTERVAL = 0.2
+HTTP_CACHE_PATH = ASSETS_PATH.parent / 'scrapper_cache'
+SEED_URL_PREFIX = 'https://usinsk.online/'
+DATE_FORMAT = '%d.%m.%Y'
+MAX_PAGE_SIZE = 2_000_000
+HTML_CONTENT_TYPE = 'text/html'
+ARTICLE_FILE_PATTERN = re.compile(r'^\d+_')
+LOGGER = logging.getLogger(__name__)
+
+TEXT_STYLE = 'text-align: justify;'
+CONTENT_CLASS = 'td-post-content'
+ARTICLE_LINK_CLASS = 'more-link'
+TITLE_CLASS = 'entry-title'
+TOPIC_CLASS = 'entry-category'
+DATE_CLASS = 'td-post-date'
+
+ARTICLE_LINK_SELECTOR = f'a.{ARTICLE_LINK_CLASS}[href]'
+TEXT_SELECTOR = f'.{CONTENT_CLASS} [style="{TEXT_STYLE}"]'
+TITLE_SELECTOR = f'.{TITLE_CLASS}'
+TOPIC_SELECTOR = f'.{TOPIC_CLASS}'
+DATE_SELECTOR = f'.{DATE_CLASS}'
+
+COMPILED_SELECTORS = {
+    selector: soupsieve.compile(selector)
+    for selector in (ARTICLE_LINK_SELECTOR, TEXT_SELECTOR, TITLE_SELECTOR,
+                     TOPIC_SELECTOR, DATE_SELECTOR)
+}
+SEED_PAGE_STRAINER = SoupStrainer('a', class_=ARTICLE_LINK_CLASS, href=True)
+ARTICLE_PAGE_STRAINER = SoupStrainer(class_=[CONTENT_CLASS, TITLE_CLASS, TOPIC_CLASS, DATE_CLASS])
+
+if builder_registry.lookup('lxml') is None:
+    raise RuntimeError('BeautifulSoup cannot find lxml parser, reinstall lxml')
+
+HTMLTree = Union[LexborHTMLParser, BeautifulSoup]
+HTMLNode = Union[LexborNode, Tag]
 
 
 class IncorrectSeedURLError(Exception):
@@ -54,6 +124,16 @@ class IncorrectVerifyError(Exception):
     Verification check or Headless mode are not boolean.
     """
 
+class IncorrectRequestIntervalError(Exception):
+    """
+    The minimal interval between requests is not a non-negative number.
+    """
+
+class IncorrectHTTPCacheError(Exception):
+    """
+    HTTP cache usage is not boolean.
+    """
+
 
 class Config:
     """
@@ -68,6 +148,10 @@ class Config:
             path_to_config (pathlib.Path): Path to configuration.
         """
         self.path_to_config = path_to_config
+        with open(self.path_to_config, 'rb') as file:
+            content = file.read()
+        # pylint: disable-next=no-member
+        self._config_content = orjson.loads(content) if orjson else json.loads(content)
         self._validate_config_content()
         self.config = self._extract_config_content()
         self._seed_urls = self.config.seed_urls
@@ -77,6 +161,34 @@ class Config:
         self._timeout = self.config.timeout
         self._should_verify_certificate = self.config.should_verify_certificate
         self._headless_mode = self.config.headless_mode
+        self._min_request_interval: float = self._config_content.get(
+            'min_request_interval', DEFAULT_MIN_REQUEST_INTERVAL)
+        self._should_use_http_cache: bool = self._config_content.get(
+            'should_use_http_cache', False)
+        self._throttler = RequestThrottler(self._min_request_interval)
+        self._session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create a session that keeps connections alive between requests.
+
+        Temporary server errors are retried with a growing delay.
+
+        Returns:
+            requests.Session: Session with configured headers
+        """
+        session = ThrottledSession(self._throttler)
+        retries = Retry(total=MAX_RETRIES,
+                        backoff_factor=RETRY_BACKOFF_FACTOR,
+                        status_forcelist=RETRY_STATUSES,
+                        raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS,
+                              pool_maxsize=POOL_MAXSIZE,
+                              max_retries=retries)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update(self._headers)
+        return session
 
     def _extract_config_content(self) -> ConfigDTO:
         """
@@ -85,8 +197,7 @@ class Config:
         Returns:
             ConfigDTO: Config values
         """
-        with open(self.path_to_config, 'r', encoding='utf-8') as file:
-            config = json.load(file)
+        config = self._config_content
         return ConfigDTO(
             seed_urls=config["seed_urls"],
             total_articles_to_find_and_parse=config["total_articles_to_find_and_parse"],
@@ -101,34 +212,42 @@ class Config:
         """
         Ensure configuration parameters are not corrupt.
         """
-        with open(self.path_to_config, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = self._config_content
+
+        if not isinstance(config['seed_urls'], list):
+            raise IncorrectSeedURLError
+
+        if not all(isinstance(seed_url, str) and seed_url.startswith(SEED_URL_PREFIX)
+                   for seed_url in config['seed_urls']):
+            raise IncorrectSeedURLError
 
-            if not isinstance(config['seed_urls'], list):
-                raise IncorrectSeedURLError
+        if (not isinstance(config['total_articles_to_find_and_parse'], int) or
+                config['total_articles_to_find_and_parse'] <= 0):
+            raise IncorrectNumberOfArticlesError
 
-            if not all(seed_url.startswith('https://usinsk.online/') for seed_url in config['seed_urls']):
-                raise IncorrectSeedURLError
+        if not 1 < config['total_articles_to_find_and_parse'] <= 150:
+            raise NumberOfArticlesOutOfRangeError
 
-            if (not isinstance(config['total_articles_to_find_and_parse'], int) or
-                    config['total_articles_to_find_and_parse'] <= 0):
-                raise IncorrectNumberOfArticlesError
+        if not isinstance(config['headers'], dict):
+            raise IncorrectHeadersError
 
-            if not 1 < config['total_articles_to_find_and_parse'] <= 150:
-                raise NumberOfArticlesOutOfRangeError
+        if not isinstance(config['encoding'], str):
+            raise IncorrectEncodingError
 
-            if not isinstance(config['headers'], dict):
-                raise IncorrectHeadersError
+        if not isinstance(config['timeout'], int) or not 0 < config['timeout'] < 60:
+            raise IncorrectTimeoutError
 
-            if not isinstance(config['encoding'], str):
-                raise IncorrectEncodingError
+        if (not isinstance(config['should_verify_certificate'], bool) or
+                not isinstance(config['headless_mode'], bool)):
+            raise IncorrectVerifyError
 
-            if not isinstance(config['timeout'], int) or not 0 < config['timeout'] < 60:
-                raise IncorrectTimeoutError
+        min_request_interval = config.get('min_request_interval', DEFAULT_MIN_REQUEST_INTERVAL)
+        if (not isinstance(min_request_interval, (int, float)) or
+                isinstance(min_request_interval, bool) or min_request_interval < 0):
+            raise IncorrectRequestIntervalError
 
-            if (not isinstance(config['should_verify_certificate'], bool) or
-                    not isinstance(config['headless_mode'], bool)):
-                raise IncorrectVerifyError
+        if not isinstance(config.get('should_use_http_cache', False), bool):
+            raise IncorrectHTTPCacheError
 
 
     def get_seed_urls(self) -> list[str]:
@@ -193,6 +312,42 @@ class Config:
         """
         return self._headless_mode
 
+    def get_min_request_interval(self) -> float:
+        """
+        Retrieve minimal number of seconds between requests to one host.
+
+        Returns:
+            float: Minimal number of seconds between requests to one host
+        """
+        return self._min_request_interval
+
+    def get_use_http_cache(self) -> bool:
+        """
+        Retrieve whether to revalidate downloaded articles with HTTP cache.
+
+        Returns:
+            bool: Whether to use HTTP cache or not
+        """
+        return self._should_use_http_cache
+
+    def get_throttler(self) -> RequestThrottler:
+        """
+        Retrieve throttler shared by all requests.
+
+        Returns:
+            RequestThrottler: Throttler
+        """
+        return self._throttler
+
+    def get_session(self) -> requests.Session:
+        """
+        Retrieve session to send requests with.
+
+        Returns:
+            requests.Session: Session
+        """
+        return self._session
+
 
 def make_request(url: str, config: Config) -> requests.models.Response:
     """
@@ -205,15 +360,165 @@ def make_request(url: str, config: Config) -> requests.models.Response:
     Returns:
         requests.models.Response: A response from a request
     """
-    time.sleep(random.randrange(3))
-    response = requests.get(url=url,
-                            timeout=config.get_timeout(),
-                            headers=config.get_headers(),
-                            verify=config.get_verify_certificate()
-                            )
+    return request_page(url, config.get_session(), config.get_timeout(),
+                        config.get_verify_certificate())
+
+
+def request_page(url: str, session: requests.Session, timeout: int,
+                 verify: bool) -> requests.models.Response:
+    """
+    Deliver a response from a request with already extracted configuration.
+
+    At most MAX_PAGE_SIZE bytes of body are read, and only for HTML pages.
+
+    Args:
+        url (str): Site url
+        session (requests.Session): Session to send request with
+        timeout (int): Request timeout
+        verify (bool): Whether to verify certificate
+
+    Returns:
+        requests.models.Response: A response from a request
+    """
+    response = session.get(url=url, timeout=timeout, verify=verify, stream=True)
+    with response:
+        content = b''
+        if response.headers.get('content-type', HTML_CONTENT_TYPE).startswith(HTML_CONTENT_TYPE):
+            content = response.raw.read(MAX_PAGE_SIZE, decode_content=True)
+        if not content or len(content) == MAX_PAGE_SIZE:
+            # unread rest of body must not get back to the connection pool
+            response.raw.close()
+        # pylint: disable=protected-access
+        response._content = content
+        response._content_consumed = True
     return response
 
 
+async def fetch(session: aiohttp.ClientSession, url: str, semaphore: asyncio.Semaphore,
+                throttler: RequestThrottler, cache: Optional[PageCache] = None) -> Optional[bytes]:
+    """
+    Download a page without blocking other downloads.
+
+    Connection errors, timeouts and temporary server errors are retried
+    with a growing delay. A cached page is returned if server confirms it is not modified.
+
+    Args:
+        session (aiohttp.ClientSession): Session to send request with
+        url (str): Site url
+        semaphore (asyncio.Semaphore): Limit of simultaneous requests
+        throttler (RequestThrottler): Throttler of requests to one host
+        cache (Optional[PageCache]): Cache of downloaded pages
+
+    Returns:
+        Optional[bytes]: HTML page or None if it is unavailable
+    """
+    async with semaphore:
+        for attempt in range(MAX_RETRIES + 1):
+            if attempt:
+                await asyncio.sleep(RETRY_BACKOFF_FACTOR * 2 ** (attempt - 1))
+            await throttler.wait_async(url)
+            try:
+                validators = cache.get_validators(url) if cache else {}
+                async with session.get(url, headers=validators) as response:
+                    if cache and response.status == HTTPStatus.NOT_MODIFIED:
+                        return cache.load(url)
+                    if response.status in RETRY_STATUSES:
+                        continue
+                    content_type = response.headers.get('Content-Type', HTML_CONTENT_TYPE)
+                    if not response.ok or not content_type.startswith(HTML_CONTENT_TYPE):
+                        return None
+                    page = bytearray()
+                    async for chunk in response.content.iter_any():
+                        page += chunk
+                        if len(page) >= MAX_PAGE_SIZE:
+                            break
+                    if cache:
+                        cache.store(url, bytes(page[:MAX_PAGE_SIZE]), response.headers)
+                    return bytes(page[:MAX_PAGE_SIZE])
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                continue
+    return None
+
+
+async def fetch_pages(urls: list[str], config: Config) -> list[Optional[bytes]]:
+    """
+    Download pages concurrently.
+
+    Args:
+        urls (list[str]): Site urls
+        config (Config): Configuration
+
+    Returns:
+        list[Optional[bytes]]: HTML pages in the order of urls
+    """
+    connector = aiohttp.TCPConnector(limit_per_host=MAX_CONNECTIONS_PER_HOST,
+                                     ssl=config.get_verify_certificate())
+    timeout = aiohttp.ClientTimeout(total=config.get_timeout())
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    throttler = config.get_throttler()
+    cache = PageCache(HTTP_CACHE_PATH) if config.get_use_http_cache() else None
+    async with aiohttp.ClientSession(connector=connector,
+                                     headers=config.get_headers(),
+                                     timeout=timeout) as session:
+        return await asyncio.gather(*[fetch(session, url, semaphore, throttler, cache)
+                                      for url in urls])
+
+
+def build_tree(page: bytes, encoding: str,
+               strainer: SoupStrainer = ARTICLE_PAGE_STRAINER) -> HTMLTree:
+    """
+    Build a tree of HTML page to search elements in.
+
+    selectolax is used when it is installed, BeautifulSoup otherwise.
+    BeautifulSoup builds only the tags accepted by strainer.
+
+    Args:
+        page (bytes): Raw HTML page
+        encoding (str): Encoding of page
+        strainer (SoupStrainer): Tags to keep in BeautifulSoup tree
+
+    Returns:
+        HTMLTree: Tree of HTML page
+    """
+    if LexborHTMLParser is not None:
+        # lexbor reads raw bytes only as UTF-8
+        if codecs.lookup(encoding).name == 'utf-8':
+            return LexborHTMLParser(page)
+        return LexborHTMLParser(page.decode(encoding, errors='replace'))
+    return BeautifulSoup(page, features='lxml', parse_only=strainer, from_encoding=encoding)
+
+
+def select_nodes(tree: HTMLTree, selector: str) -> Sequence[HTMLNode]:
+    """
+    Find all elements matching CSS selector.
+
+    Args:
+        tree (HTMLTree): Tree of HTML page
+        selector (str): CSS selector
+
+    Returns:
+        Sequence[HTMLNode]: Found elements in document order
+    """
+    if isinstance(tree, BeautifulSoup):
+        compiled = COMPILED_SELECTORS.get(selector) or soupsieve.compile(selector)
+        return compiled.select(tree)
+    return tree.css(selector)
+
+
+def get_node_text(node: HTMLNode) -> str:
+    """
+    Retrieve text of an element with all its descendants.
+
+    Args:
+        node (HTMLNode): Element of HTML page
+
+    Returns:
+        str: Text of element
+    """
+    if isinstance(node, Tag):
+        return node.text
+    return node.text()
+
 
 class Crawler:
     """
@@ -230,34 +535,53 @@ class Crawler:
             config (Config): Configuration
         """
         self.urls = []
+        self._url_set: set[str] = set()
         self.config = config
+        self._seed_urls = config.get_seed_urls()
+        self._num_articles = config.get_num_articles()
+        self._encoding = config.get_encoding()
+        self._session = config.get_session()
+        self._timeout = config.get_timeout()
+        self._verify = config.get_verify_certificate()
 
-    def _extract_url(self, article_bs: BeautifulSoup) -> str:
+    def _extract_url(self, article_bs: HTMLNode) -> str:
         """
         Find and retrieve url from HTML.
 
         Args:
-            article_bs (bs4.BeautifulSoup): BeautifulSoup instance
+            article_bs (HTMLNode): Link element of HTML page
 
         Returns:
             str: Url from HTML
         """
-        return article_bs['href']
+        if isinstance(article_bs, Tag):
+            return str(article_bs['href'])
+        return str(article_bs.attributes['href'])
 
     def find_articles(self) -> None:
         """
         Find articles.
+
+        Seed pages are requested in parallel threads and processed in their order.
         """
-        for url in self.get_search_urls():
-            res = make_request(url, self.config)
-            if not res.ok:
-                continue
-            soup = BeautifulSoup(res.text, 'lxml')
-            for link in soup.find_all(class_='more-link'):
-                if len(self.urls) == (self.config.get_num_articles()):
+        with ThreadPoolExecutor(max_workers=MAX_SEED_REQUEST_WORKERS) as executor:
+            responses = executor.map(request_page, self.get_search_urls(), repeat(self._session),
+                                     repeat(self._timeout), repeat(self._verify))
+            for res in responses:
+                if len(self.urls) == self._num_articles:
                     break
-                if self._extract_url(link) not in self.urls:
-                    self.urls.append(self._extract_url(link))
+                if not res.ok:
+                    continue
+                tree = build_tree(res.content, self._encoding, SEED_PAGE_STRAINER)
+                for link in select_nodes(tree, ARTICLE_LINK_SELECTOR):
+                    if len(self.urls) == self._num_articles:
+                        break
+                    article_url = self._extract_url(link)
+                    if article_url in self._url_set:
+                        continue
+                    self.urls.append(article_url)
+                    self._url_set.add(article_url)
+            executor.shutdown(cancel_futures=True)
 
 
     def get_search_urls(self) -> list:
@@ -267,7 +591,7 @@ class Crawler:
         Returns:
             list: seed_urls param
         """
-        return self.config.get_seed_urls()
+        return self._seed_urls
 
 
 # 10
@@ -291,37 +615,30 @@ class HTMLParser:
         self.full_url = full_url
         self.article_id = article_id
         self.config = config
+        self._encoding = config.get_encoding()
+        self._session = config.get_session()
+        self._timeout = config.get_timeout()
+        self._verify = config.get_verify_certificate()
         self.article = Article(self.full_url, self.article_id)
 
 
-    def _fill_article_with_text(self, article_soup: BeautifulSoup) -> None:
+    def _fill_article_with_text(self, article_soup: HTMLTree) -> None:
         """
         Find text of article.
 
         Args:
-            article_soup (bs4.BeautifulSoup): BeautifulSoup instance
+            article_soup (HTMLTree): Tree of article page
         """
-        texts = []
-        text_paragraphs = article_soup.find_all(style="text-align: justify;")
-        for paragraph in text_paragraphs:
-            texts.append(paragraph.text)
-        self.article.text = '\n'.join(texts)
+        fill_article_with_text(self.article, article_soup)
 
-    def _fill_article_with_meta_information(self, article_soup: BeautifulSoup) -> None:
+    def _fill_article_with_meta_information(self, article_soup: HTMLTree) -> None:
         """
         Find meta information of article.
 
         Args:
-            article_soup (bs4.BeautifulSoup): BeautifulSoup instance
+            article_soup (HTMLTree): Tree of article page
         """
-        self.article.title = article_soup.find(class_='entry-title').text
-        self.article.author = ['NOT FOUND']
-        topics = []
-        topics_soup = article_soup.find_all(class_='entry-category')
-        for topic in topics_soup:
-            topics.append(topic.text)
-        self.article.topics = topics
-        self.article.date = self.unify_date_format(article_soup.find(class_='td-post-date').text)
+        fill_article_with_meta_information(self.article, article_soup)
 
     def unify_date_format(self, date_str: str) -> datetime.datetime:
         """
@@ -333,8 +650,7 @@ class HTMLParser:
         Returns:
             datetime.datetime: Datetime object
         """
-        date_str = date_str[:-4] + date_str[-2:]
-        return datetime.datetime.strptime(date_str, '%d.%m.%y')
+        return unify_date_format(date_str)
 
 
     def parse(self) -> Union[Article, bool, list]:
@@ -344,27 +660,218 @@ class HTMLParser:
         Returns:
             Union[Article, bool, list]: Article instance
         """
-        response = make_request(self.full_url, self.config)
-        if response.ok:
-            article_bs = BeautifulSoup(response.text, 'lxml')
-            self._fill_article_with_text(article_bs)
-            self._fill_article_with_meta_information(article_bs)
+        response = request_page(self.full_url, self._session, self._timeout, self._verify)
+        if response.ok and response.content:
+            self.parse_page(response.content)
 
         return self.article
 
+    def parse_page(self, page: bytes) -> Article:
+        """
+        Parse article from already downloaded HTML page.
+
+        Args:
+            page (bytes): Raw HTML page of article
 
-def prepare_environment(base_path: Union[pathlib.Path, str]) -> None:
+        Returns:
+            Article: Article instance
+        """
+        return parse_article_page(self.article, page, self._encoding)
+
+
+def unify_date_format(date_str: str) -> datetime.datetime:
+    """
+    Unify date format.
+
+    Args:
+        date_str (str): Date in text format
+
+    Returns:
+        datetime.datetime: Datetime object
+    """
+    return datetime.datetime.strptime(date_str.strip(), DATE_FORMAT)
+
+
+def fill_article_with_text(article: Article, article_tree: HTMLTree) -> None:
+    """
+    Find text of article.
+
+    Args:
+        article (Article): Article to fill
+        article_tree (HTMLTree): Tree of article page
+    """
+    text_paragraphs = select_nodes(article_tree, TEXT_SELECTOR)
+    article.text = '\n'.join(get_node_text(paragraph) for paragraph in text_paragraphs)
+
+
+def fill_article_with_meta_information(article: Article, article_tree: HTMLTree) -> None:
+    """
+    Find meta information of article.
+
+    Args:
+        article (Article): Article to fill
+        article_tree (HTMLTree): Tree of article page
+    """
+    article.title = get_node_text(select_nodes(article_tree, TITLE_SELECTOR)[0])
+    article.author = ['NOT FOUND']
+    article.topics = [get_node_text(topic) for topic in select_nodes(article_tree, TOPIC_SELECTOR)]
+    date_node = select_nodes(article_tree, DATE_SELECTOR)[0]
+    article.date = unify_date_format(get_node_text(date_node))
+
+
+def parse_article_page(article: Article, page: bytes, encoding: str) -> Article:
+    """
+    Fill article with text and meta information from downloaded HTML page.
+
+    Args:
+        article (Article): Article to fill
+        page (bytes): Raw HTML page of article
+        encoding (str): Encoding of page
+
+    Returns:
+        Article: Article instance
+    """
+    article_tree = build_tree(page, encoding)
+    fill_article_with_text(article, article_tree)
+    fill_article_with_meta_information(article, article_tree)
+    return article
+
+
+_WORKER_ENCODING: dict[str, str] = {}
+
+
+def _init_parsing_worker(encoding: str) -> None:
+    """
+    Remember encoding of pages once per parsing worker process.
+
+    Args:
+        encoding (str): Encoding of pages
+    """
+    _WORKER_ENCODING['encoding'] = encoding
+
+
+def _parse_one(payload: tuple[str, int, bytes]) -> Article:
+    """
+    Parse downloaded article in a worker process.
+
+    Args:
+        payload (tuple[str, int, bytes]): Article url, id and HTML page
+
+    Returns:
+        Article: Article instance
+    """
+    full_url, article_id, page = payload
+    return parse_article_page(Article(full_url, article_id), page, _WORKER_ENCODING['encoding'])
+
+
+def write_articles(articles: Queue) -> None:
+    """
+    Save raw texts and meta information of articles from queue.
+
+    Writing stops when None is received.
+
+    Args:
+        articles (Queue): Queue of parsed articles
+    """
+    while (article := articles.get()) is not None:
+        to_raw(article)
+        to_meta(article)
+
+
+def is_article_saved(full_url: str, article_id: int) -> bool:
+    """
+    Check whether article from url is already saved under given id.
+
+    Args:
+        full_url (str): Article url
+        article_id (int): Article id
+
+    Returns:
+        bool: Whether non-empty raw text and meta information of article are saved
+    """
+    article = Article(full_url, article_id)
+    raw_path = article.get_raw_text_path()
+    meta_path = article.get_meta_file_path()
+    if not raw_path.exists() or not raw_path.stat().st_size or not meta_path.exists():
+        return False
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as meta_file:
+            meta = json.load(meta_file)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return False
+    return isinstance(meta, dict) and meta.get('url') == full_url
+
+
+def remove_article_files(full_url: str, article_id: int) -> None:
+    """
+    Remove raw text and meta information saved under given id.
+
+    Args:
+        full_url (str): Article url
+        article_id (int): Article id
     """
-    Create ASSETS_PATH folder if no created and remove existing folder.
+    article = Article(full_url, article_id)
+    article.get_raw_text_path().unlink(missing_ok=True)
+    article.get_meta_file_path().unlink(missing_ok=True)
+
+
+def remove_extra_articles(base_path: Union[pathlib.Path, str], num_articles: int) -> None:
+    """
+    Remove files of articles with ids greater than number of articles.
 
     Args:
         base_path (Union[pathlib.Path, str]): Path where articles stores
+        num_articles (int): Number of articles to keep
+    """
+    for path in pathlib.Path(base_path).iterdir():
+        if not path.is_file() or not ARTICLE_FILE_PATTERN.match(path.name):
+            continue
+        if get_article_id_from_filepath(path) > num_articles:
+            path.unlink()
+
+
+def download_articles(urls: list[str], config: Config) -> tuple[list[str], dict[str, bytes]]:
     """
-    if base_path.exists():
-        shutil.rmtree(base_path)
-    base_path.mkdir(parents=True)
+    Download articles that are not saved under their ids yet.
 
+    Articles that fail to download are dropped, so that ids of the rest stay
+    consecutive. Saved articles moved to other ids by that are downloaded again.
 
+    Args:
+        urls (list[str]): Article urls in order of their ids
+        config (Config): Configuration
+
+    Returns:
+        tuple[list[str], dict[str, bytes]]: Article urls that are kept
+            and HTML pages of articles to save by their urls
+    """
+    pages: dict[str, bytes] = {}
+    while True:
+        unsaved = [(url, i) for i, url in enumerate(urls, 1)
+                   if url not in pages and not is_article_saved(url, i)]
+        if not unsaved:
+            return urls, pages
+        for url, i in unsaved:
+            remove_article_files(url, i)
+        fetched = asyncio.run(fetch_pages([url for url, _ in unsaved], config))
+        failed = set()
+        for (url, _), page in zip(unsaved, fetched):
+            if page:
+                pages[url] = page
+            else:
+                LOGGER.warning('Failed to download article %s', url)
+                failed.add(url)
+        urls = [url for url in urls if url not in failed]
+
+
+def prepare_environment(base_path: Union[pathlib.Path, str]) -> None:
+    """
+    Create ASSETS_PATH folder if no created, existing articles are kept.
+
+    Args:
+        base_path (Union[pathlib.Path, str]): Path where articles stores
+    """
+    pathlib.Path(base_path).mkdir(parents=True, exist_ok=True)
 
 
 def main() -> None:
@@ -374,14 +881,31 @@ def main() -> None:
     conf = Config(CRAWLER_CONFIG_PATH)
     prepare_environment(ASSETS_PATH)
     crawler = Crawler(conf)
-    crawler.find_articles()
-
-
-    for i, url in enumerate(crawler.urls, 1):
-        parser = HTMLParser(url, i, conf)
-        article = parser.parse()
-        to_raw(article)
-        to_meta(article)
+    try:
+        crawler.find_articles()
+    finally:
+        conf.get_session().close()
+
+    crawler.urls, pages = download_articles(crawler.urls, conf)
+    remove_extra_articles(ASSETS_PATH, len(crawler.urls))
+    payloads = [(url, i, pages[url]) for i, url in enumerate(crawler.urls, 1) if url in pages]
+    articles: Queue[Optional[Article]] = Queue()
+    with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                             initializer=_init_parsing_worker,
+                             initargs=(conf.get_encoding(),)) as pool:
+        # submitting starts the worker processes, so they are forked
+        # before the writer thread exists
+        parsed = pool.map(_parse_one, payloads, chunksize=PARSING_CHUNK_SIZE)
+        with ThreadPoolExecutor(max_workers=1) as writer_pool:
+            writer = writer_pool.submit(write_articles, articles)
+            try:
+                for article in parsed:
+                    if writer.done():
+                        break
+                    articles.put(article)
+            finally:
+                articles.put(None)
+    writer.result()
 
 
 if __name__ == "__main__":
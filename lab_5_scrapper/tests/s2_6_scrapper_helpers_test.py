@@ -0,0 +1,233 @@
+"""
+Checks for request throttling, page downloading and incremental re-runs.
+"""
+import asyncio
+import pathlib
+import shutil
+import tempfile
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from unittest import mock
+
+import pytest
+
+from core_utils.article.article import Article
+from core_utils.article.io import to_meta, to_raw
+from core_utils.constants import CRAWLER_CONFIG_PATH
+from lab_5_scrapper.http_utils import RequestThrottler
+from lab_5_scrapper.scrapper import (Config, download_articles, fetch_pages, is_article_saved,
+                                     make_request, MAX_PAGE_SIZE, remove_extra_articles)
+
+ARTICLE_PAGE = ('<html><body><h1 class="entry-title">Title</h1>'
+                '<div class="td-post-content"><p style="text-align: justify;">Text</p></div>'
+                '</body></html>').encode('utf-8')
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    Local website serving articles, a big page, a JSON page and a flaky page.
+    """
+
+    hits: dict[str, int] = {}
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """
+        Answer GET request.
+        """
+        self.hits[self.path] = self.hits.get(self.path, 0) + 1
+        if self.path.startswith('/article/'):
+            self._answer(200, 'text/html', ARTICLE_PAGE)
+        elif self.path == '/big':
+            self._answer(200, 'text/html', b'a' * (MAX_PAGE_SIZE + 1000))
+        elif self.path == '/json':
+            self._answer(200, 'application/json', b'{}')
+        elif self.path == '/flaky' and self.hits[self.path] == 1:
+            self._answer(503, 'text/html', b'')
+        elif self.path == '/flaky':
+            self._answer(200, 'text/html', ARTICLE_PAGE)
+        else:
+            self._answer(404, 'text/html', b'')
+
+    def _answer(self, status: int, content_type: str, body: bytes) -> None:
+        """
+        Send response.
+
+        Args:
+            status (int): Status code
+            content_type (str): Content type of body
+            body (bytes): Body
+        """
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        """
+        Keep test output clean.
+
+        Args:
+            *args (object): Message parts
+        """
+
+
+class ScrapperHelpersTest(unittest.TestCase):
+    """
+    Checks for helpers of the scrapper run against a local website.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Start local website.
+        """
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f'http://127.0.0.1:{cls.server.server_address[1]}'
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """
+        Stop local website.
+        """
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for ScrapperHelpersTest class.
+        """
+        _Handler.hits.clear()
+        self.config = Config(CRAWLER_CONFIG_PATH)
+        self.assets_path = pathlib.Path(tempfile.mkdtemp())
+        patcher = mock.patch('core_utils.article.article.ASSETS_PATH', self.assets_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.assets_path)
+        self.addCleanup(self.config.get_session().close)
+
+    def _save(self, url: str, article_id: int) -> None:
+        """
+        Save article as a previous run would do.
+
+        Args:
+            url (str): Article url
+            article_id (int): Article id
+        """
+        article = Article(url, article_id)
+        article.text = 'Text'
+        to_raw(article)
+        to_meta(article)
+
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scrapper
+    def test_throttler_spaces_requests_to_one_host(self) -> None:
+        """
+        Ensure requests to one host are spaced and other hosts are not delayed.
+        """
+        throttler = RequestThrottler(0.1)
+        start = time.monotonic()
+        for _ in range(3):
+            throttler.wait('http://first.host/page')
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+        start = time.monotonic()
+        throttler.wait('http://second.host/page')
+        self.assertLess(time.monotonic() - start, 0.1)
+
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scrapper
+    def test_make_request_truncates_big_page(self) -> None:
+        """
+        Ensure make_request reads at most MAX_PAGE_SIZE bytes.
+        """
+        response = make_request(f'{self.base_url}/big', self.config)
+        self.assertTrue(response.ok)
+        self.assertEqual(len(response.content), MAX_PAGE_SIZE)
+
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scrapper
+    def test_make_request_skips_non_html_body(self) -> None:
+        """
+        Ensure make_request does not read body of non-HTML page.
+        """
+        response = make_request(f'{self.base_url}/json', self.config)
+        self.assertTrue(response.ok)
+        self.assertEqual(response.content, b'')
+
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scrapper
+    def test_fetch_pages_handles_big_non_html_and_flaky_pages(self) -> None:
+        """
+        Ensure fetch_pages truncates, rejects non-HTML pages and retries server errors.
+        """
+        urls = [f'{self.base_url}/big', f'{self.base_url}/json', f'{self.base_url}/flaky',
+                f'{self.base_url}/missing']
+        big, json_page, flaky, missing = asyncio.run(fetch_pages(urls, self.config))
+        self.assertEqual(len(big or b''), MAX_PAGE_SIZE)
+        self.assertIsNone(json_page)
+        self.assertEqual(flaky, ARTICLE_PAGE)
+        self.assertEqual(_Handler.hits['/flaky'], 2)
+        self.assertIsNone(missing)
+
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scrapper
+    def test_saved_articles_are_not_downloaded_again(self) -> None:
+        """
+        Ensure articles saved under the same id are skipped.
+        """
+        url = f'{self.base_url}/article/1'
+        self._save(url, 1)
+        urls, pages = download_articles([url], self.config)
+        self.assertEqual(urls, [url])
+        self.assertEqual(pages, {})
+        self.assertNotIn('/article/1', _Handler.hits)
+
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scrapper
+    def test_broken_meta_file_means_article_is_not_saved(self) -> None:
+        """
+        Ensure truncated meta file does not count as saved article.
+        """
+        url = f'{self.base_url}/article/1'
+        self._save(url, 1)
+        Article(url, 1).get_meta_file_path().write_text('{"url": "ht', encoding='utf-8')
+        self.assertFalse(is_article_saved(url, 1))
+
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scrapper
+    def test_stale_files_are_removed_when_download_fails(self) -> None:
+        """
+        Ensure failed download neither leaves stale articles nor a gap in ids.
+        """
+        old_urls = [f'{self.base_url}/article/{i}' for i in range(1, 5)]
+        for article_id, url in enumerate(old_urls, 1):
+            self._save(url, article_id)
+
+        new_urls = [f'{self.base_url}/missing'] + old_urls[:3]
+        urls, pages = download_articles(new_urls, self.config)
+        remove_extra_articles(self.assets_path, len(urls))
+
+        self.assertEqual(urls, old_urls[:3])
+        self.assertEqual(set(pages), set(old_urls[:3]))
+        self.assertEqual(list(self.assets_path.iterdir()), [])
+
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scrapper
+    def test_extra_articles_cleanup_ignores_other_files(self) -> None:
+        """
+        Ensure only article files with too big ids are removed.
+        """
+        for article_id in (1, 2, 3):
+            self._save(f'{self.base_url}/article/{article_id}', article_id)
+        (self.assets_path / '.DS_Store').touch()
+        (self.assets_path / '7_images').mkdir()
+
+        remove_extra_articles(self.assets_path, 2)
+
+        self.assertEqual(sorted(path.name for path in self.assets_path.iterdir()),
+                         ['.DS_Store', '1_meta.json', '1_raw.txt', '2_meta.json',
+                          '2_raw.txt', '7_images'])